@@ -80,8 +80,6 @@ conda install -y -c conda-forge \
 
 ################################################################################
 # Third-best way to install packages: pip
-pip install memoized-property
-
 # Watson tooling requires pyyaml to be installed this way.
 pip install pyyaml
 
@@ -56,11 +56,13 @@ class SpanAccessor:
 
     @property
     def begin(self):
-        return pd.Series(self._values.begin)
+        # Copy so that the result is writable and independent of the spans,
+        # whichever span type backs the column.
+        return pd.Series(self._values.begin.copy())
 
     @property
     def end(self):
-        return pd.Series(self._values.end)
+        return pd.Series(self._values.end.copy())
 
     @property
     def covered_text(self):
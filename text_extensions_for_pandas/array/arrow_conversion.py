@@ -181,9 +181,11 @@ def token_span_to_arrow(token_span: TokenSpanArray) -> pa.ExtensionArray:
     :param token_span: A TokenSpanArray to be converted
     :return: pyarrow.ExtensionArray containing TokenSpan data
     """
-    # Create arrays for begins/ends
-    token_begins_array = pa.array(token_span.begin_token)
-    token_ends_array = pa.array(token_span.end_token)
+    # Create arrays for begins/ends. All fields of the struct share one index
+    # type, so store token offsets with the same type as character offsets.
+    index_dtype = token_span.tokens.begin.dtype
+    token_begins_array = pa.array(token_span.begin_token.astype(index_dtype, copy=False))
+    token_ends_array = pa.array(token_span.end_token.astype(index_dtype, copy=False))
     token_span_arrays = [token_begins_array, token_ends_array]
 
     num_char_span_splits = 0
@@ -364,7 +366,8 @@ class ArrowTensorArray(object):
             child_buf = pa.py_buffer(obj)
             child_array = pa.Array.from_buffers(pa_dtype, total_num_elements, [None, child_buf])
 
-            offset_buf = pa.py_buffer(np.int32([i * num_elements for i in range(batch_size + 1)]))
+            offsets = np.arange(batch_size + 1, dtype=np.int32) * np.int32(num_elements)
+            offset_buf = pa.py_buffer(offsets)
 
             storage = pa.Array.from_buffers(pa.list_(pa_dtype), batch_size,
                                             [None, offset_buf], children=[child_array])
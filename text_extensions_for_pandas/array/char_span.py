@@ -25,7 +25,7 @@ from typing import *
 
 import numpy as np
 import pandas as pd
-from memoized_property import memoized_property
+from pandas._libs.properties import cache_readonly
 
 # Internal imports
 import text_extensions_for_pandas.util as util
@@ -44,6 +44,10 @@ class CharSpan:
     # "not a number".
     NULL_OFFSET_VALUE = -1  # Type: int
 
+    # Spans are created once per row, so skip the per-instance __dict__.
+    # "_cache" holds the values of @cache_readonly properties.
+    __slots__ = ("_text", "_begin", "_end", "_cache")
+
     def __init__(self, text: str, begin: int, end: int):
         """
         Args:
@@ -110,7 +114,7 @@ class CharSpan:
     def target_text(self):
         return self._text
 
-    @memoized_property
+    @cache_readonly
     def covered_text(self):
         """
         Returns the substring of `self.target_text` that this `CharSpan`
@@ -210,6 +214,24 @@ class CharSpanType(pd.api.extensions.ExtensionDtype):
         from text_extensions_for_pandas.array.arrow_conversion import arrow_to_char_span
         return arrow_to_char_span(extension_array)
 
+    def __eq__(self, other):
+        """
+        Instances of this dtype carry no parameters, so two dtypes are equal
+        exactly when they are of the same class. This check is stricter than
+        the superclass's `isinstance()` test, which would consider a
+        `TokenSpanType` to be equal to a `CharSpanType`.
+        """
+        if isinstance(other, str):
+            return other == self.name
+        return type(other) is type(self)
+
+    def __hash__(self):
+        return hash(self.name)
+
+
+# Dtypes are immutable, so every CharSpanArray can share a single instance.
+_CHAR_SPAN_TYPE = CharSpanType()
+
 
 class CharSpanArray(pd.api.extensions.ExtensionArray):
     """
@@ -234,8 +256,13 @@ class CharSpanArray(pd.api.extensions.ExtensionArray):
         if not isinstance(ends, (pd.Series, np.ndarray, list)):
             raise TypeError(f"ends is of unsupported type {type(ends)}. "
                             f"Supported types are Series, ndarray and List[int].")
-        begins = np.array(begins) if not isinstance(begins, np.ndarray) else begins
-        ends = np.array(ends) if not isinstance(ends, np.ndarray) else ends
+        # Copy lists and Series so that `__setitem__()` doesn't modify the
+        # caller's data. Arrays are shared unless they are read-only, such as
+        # the `begin` property of a `TokenSpanArray`.
+        begins = (np.require(begins, requirements=["W"])
+                  if isinstance(begins, np.ndarray) else np.array(begins))
+        ends = (np.require(ends, requirements=["W"])
+                if isinstance(ends, np.ndarray) else np.array(ends))
 
         if not np.issubdtype(begins.dtype, np.integer):
             raise TypeError(f"Begins array is of dtype {begins.dtype}, "
@@ -272,11 +299,23 @@ class CharSpanArray(pd.api.extensions.ExtensionArray):
         See docstring in `ExtensionArray` class in `pandas/core/arrays/base.py`
         for information about this method.
         """
-        return CharSpanType()
+        return _CHAR_SPAN_TYPE
 
     def __len__(self) -> int:
         return len(self._begins)
 
+    def __array__(self, dtype=None) -> np.ndarray:
+        """
+        Interface to convert this array to a Numpy array of `CharSpan` objects.
+        Builds all the spans in a single pass, instead of having Numpy and
+        Pandas fetch them one at a time via `__getitem__()`.
+        """
+        text = self._text
+        result = np.empty(len(self), dtype=object)
+        result[:] = [CharSpan(text, b, e)
+                     for b, e in zip(self._begins.tolist(), self._ends.tolist())]
+        return result if dtype is None else np.asarray(result, dtype=dtype)
+
     def __getitem__(self, item) -> Union[CharSpan, "CharSpanArray"]:
         """
         See docstring in `ExtensionArray` class in `pandas/core/arrays/base.py`
@@ -608,9 +647,14 @@ class CharSpanArray(pd.api.extensions.ExtensionArray):
         """
         Returns (begin, end) pairs as an array of tuples
         """
-        return np.concatenate(
-            (self.begin.reshape((-1, 1)), self.end.reshape((-1, 1))),
-            axis=1)
+        begins = self.begin
+        ends = self.end
+        # Fill a single preallocated buffer instead of concatenating reshaped
+        # copies of the two columns.
+        result = np.empty((len(self), 2), dtype=np.result_type(begins, ends))
+        result[:, 0] = begins
+        result[:, 1] = ends
+        return result
 
     @property
     def covered_text(self) -> np.ndarray:
@@ -618,19 +662,22 @@ class CharSpanArray(pd.api.extensions.ExtensionArray):
         :return: an array of the substrings of `target_text` corresponding to
         the spans in this array.
         """
-        # TODO: Vectorized version of this
         text = self.target_text
+        # Pull the character offsets out once, as Python ints, so that the
+        # loop below is a single pass of native string slicing with no
+        # per-element attribute or Numpy scalar lookups. Subclasses reuse this
+        # method by overriding the `begin` and `end` properties.
+        begins = self.begin.tolist()
+        ends = self.end.tolist()
         # Need dtype=np.object so we can return nulls
-        result = np.zeros(len(self), dtype=np.object)
-        for i in range(len(self)):
-            if self._begins[i] == CharSpan.NULL_OFFSET_VALUE:
-                # Null value at this index
-                result[i] = None
-            else:
-                result[i] = text[self._begins[i]:self._ends[i]]
+        result = np.empty(len(self), dtype=np.object)
+        result[:] = [text[b:e] for b, e in zip(begins, ends)]
+        # Null spans have offsets of NULL_OFFSET_VALUE, which slice out an
+        # empty string above.
+        result[self.isna()] = None
         return result
 
-    @memoized_property
+    @cache_readonly
     def normalized_covered_text(self) -> np.ndarray:
         """
         :return: A normalized version of the covered text of the spans in this
@@ -75,6 +75,22 @@ class TensorType(pd.api.extensions.ExtensionDtype):
         values = ArrowTensorArray.to_numpy(extension_array)
         return TensorArray(values)
 
+    def __eq__(self, other):
+        """
+        Instances of this dtype carry no parameters, so two dtypes are equal
+        exactly when they are of the same class.
+        """
+        if isinstance(other, str):
+            return other == self.name
+        return type(other) is type(self)
+
+    def __hash__(self):
+        return hash(self.name)
+
+
+# Dtypes are immutable, so every TensorArray can share a single instance.
+_TENSOR_TYPE = TensorType()
+
 
 class TensorOpsMixin(pd.api.extensions.ExtensionScalarOpsMixin):
     """
@@ -95,6 +111,53 @@ class TensorOpsMixin(pd.api.extensions.ExtensionScalarOpsMixin):
         op_name = ops._get_op_name(op, True)
         return set_function_name(_binop, op_name, cls)
 
+    @classmethod
+    def _create_comparison_method(cls, op):
+        # Comparisons that produce one boolean per row return the ndarray from
+        # Numpy as is, since Pandas unwraps the result into a boolean mask
+        # anyway. Element-wise results over higher-rank tensors stay wrapped in
+        # a TensorArray, because a Series can only hold 1-D values.
+
+        def _cmpop(self, other):
+            lvalues = self._tensor
+            rvalues = other._tensor if isinstance(other, TensorArray) else other
+            res = op(lvalues, rvalues)
+            if np.ndim(res) == 0:
+                # Numpy returns a single scalar when it can't compare the
+                # operands element-wise.
+                raise TypeError(
+                    f"Cannot compare TensorArray of shape {lvalues.shape} "
+                    f"element-wise with {type(other).__name__} "
+                    f"'{other}'")
+            return res if res.ndim == 1 else TensorArray(res)
+
+        op_name = ops._get_op_name(op, True)
+        return set_function_name(_cmpop, op_name, cls)
+
+
+def _stack_tensors(values: Sequence[np.ndarray]) -> np.ndarray:
+    """
+    Stack a sequence of tensors along a new outer dimension.
+
+    :param values: Sequence of `numpy.ndarray`s of equal shape
+    :return: A single `numpy.ndarray` with one row per element of `values`
+    """
+    if len(values) == 0:
+        return np.array([])
+    first = values[0]
+    if (isinstance(values, (list, tuple)) and isinstance(first, np.ndarray)
+            and all(isinstance(v, np.ndarray) and v.shape == first.shape
+                    and v.dtype == first.dtype for v in values)):
+        # Common case: a list of tensors of identical shape and dtype. Copy
+        # them into a preallocated buffer, skipping the per-element checks and
+        # intermediate buffers of np.stack().
+        out = np.empty((len(values),) + first.shape, dtype=first.dtype)
+        for i, v in enumerate(values):
+            out[i] = v
+        return out
+    # Irregular input; let np.stack() coerce or reject it.
+    return np.stack(values, axis=0)
+
 
 class TensorArray(pd.api.extensions.ExtensionArray, TensorOpsMixin):
     """
@@ -104,15 +167,18 @@ class TensorArray(pd.api.extensions.ExtensionArray, TensorOpsMixin):
     """
 
     def __init__(self, values: Union[np.ndarray, Sequence[np.ndarray]],
-                 make_contiguous: bool = True):
+                 make_contiguous: bool = False):
         """
         :param values: A `numpy.ndarray` or sequence of `numpy.ndarray`s of equal shape.
-        :param make_contiguous: force values to be contiguous in memory
+        :param make_contiguous: force values to be contiguous in memory right
+         away. Otherwise a non-contiguous `values` is only copied when an
+         operation that needs contiguous memory, such as conversion to Arrow,
+         calls `_ensure_contiguous()`.
         """
         if isinstance(values, np.ndarray):
             self._tensor = values
         elif isinstance(values, Sequence):
-            self._tensor = np.stack(values, axis=0) if len(values) > 0 else np.array([])
+            self._tensor = _stack_tensors(values)
         else:
             raise TypeError(f"Expected a numpy.ndarray or sequence of numpy.ndarray, "
                             f"but received {values} "
@@ -129,7 +195,16 @@ class TensorArray(pd.api.extensions.ExtensionArray, TensorOpsMixin):
         See docstring in `ExtensionArray` class in `pandas/core/arrays/base.py`
         for information about this method.
         """
-        return TensorArray(np.concatenate([a._tensor for a in to_concat]))
+        tensors = [a._tensor for a in to_concat]
+        # Each input already has a leading batch dimension, so concatenate
+        # along that dimension directly into one preallocated, C-contiguous
+        # buffer.
+        out = np.empty(
+            (sum(len(t) for t in tensors),) + tensors[0].shape[1:],
+            dtype=np.result_type(*{t.dtype for t in tensors}),
+        )
+        np.concatenate(tensors, axis=0, out=out)
+        return TensorArray(out, make_contiguous=False)
 
     def isna(self) -> np.array:
         """
@@ -137,7 +212,12 @@ class TensorArray(pd.api.extensions.ExtensionArray, TensorOpsMixin):
         for information about this method.
         """
         # TODO any or all values in row nan?
-        return np.any(np.isnan(self._tensor), axis=1)
+        t = self._tensor
+        if t.dtype.kind not in "fc":
+            # Only floating-point and complex tensors can contain NaN.
+            return np.zeros(len(self), dtype=bool)
+        # Reduce over every dimension except the outer one.
+        return np.isnan(t).any(axis=tuple(range(1, t.ndim)))
 
     def copy(self) -> "TensorArray":
         """
@@ -176,7 +256,7 @@ class TensorArray(pd.api.extensions.ExtensionArray, TensorOpsMixin):
         See docstring in `ExtensionArray` class in `pandas/core/arrays/base.py`
         for information about this method.
         """
-        return TensorType()
+        return _TENSOR_TYPE
 
     def to_numpy(self, dtype=None, copy=False, na_value=pd.api.extensions.no_default):
         """
@@ -189,6 +269,14 @@ class TensorArray(pd.api.extensions.ExtensionArray, TensorOpsMixin):
     def __len__(self) -> int:
         return len(self._tensor)
 
+    def __array__(self, dtype=None):
+        """
+        Interface to return the backing tensor as a numpy array. Lets
+        `np.asarray()` and friends use the tensor directly instead of
+        iterating over the rows of this array.
+        """
+        return np.asarray(self._tensor, dtype=dtype)
+
     def __getitem__(self, item) -> "TensorArray":
         """
         See docstring in `Extension   Array` class in `pandas/core/arrays/base.py`
@@ -234,7 +322,19 @@ class TensorArray(pd.api.extensions.ExtensionArray, TensorOpsMixin):
 
     def __arrow_array__(self, type=None):
         from text_extensions_for_pandas.array.arrow_conversion import ArrowTensorArray
-        return ArrowTensorArray.from_numpy(self._tensor)
+        return ArrowTensorArray.from_numpy(self._ensure_contiguous())
+
+    def _ensure_contiguous(self) -> np.ndarray:
+        """
+        Make the backing tensor C-contiguous, for operations that need a single
+        contiguous buffer. The copy, if one is needed, replaces the backing
+        tensor, so it happens at most once.
+
+        :return: The backing tensor, which is now C-contiguous
+        """
+        if not self._tensor.flags.c_contiguous:
+            self._tensor = np.ascontiguousarray(self._tensor)
+        return self._tensor
 
 
 # Add operators from the mixin to the class
@@ -185,6 +185,14 @@ class CharSpanArrayTest(ArrayTestBase):
         self.assertEqual(arr[2].covered_text, "a")
         self._assertArrayEquals(arr[2:4].covered_text, ["a", "test"])
 
+    def test_array(self):
+        arr = self._make_spans_of_tokens()
+        arr[1] = CharSpan(arr.target_text, CharSpan.NULL_OFFSET_VALUE,
+                          CharSpan.NULL_OFFSET_VALUE)
+        np_arr = np.asarray(arr)
+        self.assertEqual(np_arr.dtype, np.object)
+        self.assertEqual(np_arr.tolist(), [arr[i] for i in range(len(arr))])
+
     def test_setitem(self):
         arr = self._make_spans_of_tokens()
         arr[1] = arr[2]
@@ -194,6 +202,29 @@ class CharSpanArrayTest(ArrayTestBase):
         with self.assertRaises(ValueError):
             arr[0] = "Invalid argument for __setitem__()"
 
+    def test_span_accessor(self):
+        arr = self._make_spans_of_tokens()
+        s = pd.Series(arr)
+        self.assertEqual(s.span.begin.tolist(), [0, 5, 8, 10])
+        self.assertEqual(s.span.end.tolist(), [4, 7, 9, 14])
+        self._assertArrayEquals(s.span.covered_text, ["This", "is", "a", "test"])
+        # The begin and end Series are writable copies.
+        begins = s.span.begin
+        begins.iloc[0] = 99
+        ends = s.span.end
+        ends.iloc[0] = 99
+        self.assertEqual(arr.begin[0], 0)
+        self.assertEqual(arr.end[0], 4)
+
+    def test_setitem_copies_series(self):
+        begins = pd.Series([0, 5, 8, 10])
+        ends = pd.Series([4, 7, 9, 14])
+        arr = CharSpanArray("This is a test", begins, ends)
+        arr[1] = arr[2]
+        self._assertArrayEquals(arr.covered_text, ["This", "a", "a", "test"])
+        self.assertEqual(begins.tolist(), [0, 5, 8, 10])
+        self.assertEqual(ends.tolist(), [4, 7, 9, 14])
+
     def test_equals(self):
         arr = self._make_spans_of_tokens()
         self._assertArrayEquals(arr[0:4] == arr[1], [False, True, False, False])
@@ -41,6 +41,11 @@ class TestTensor(unittest.TestCase):
         x = [np.ones([2, 3])] * 5
         s = TensorArray(x)
         self.assertEqual(len(s), 5)
+        self.assertEqual(s.to_numpy().shape, (5, 2, 3))
+
+        x = [np.ones([2], dtype=np.int32), np.full([2], 0.5)]
+        s = TensorArray(x)
+        self.assertEqual(s.to_numpy().dtype, np.float64)
 
         x = np.empty((0, 2))
         s = TensorArray(x)
@@ -55,6 +60,15 @@ class TestTensor(unittest.TestCase):
         with self.assertRaises(TypeError):
             TensorArray(2112)
 
+        # Non-contiguous values are only copied on request
+        x = np.ones([3, 4])[:, ::2]
+        s = TensorArray(x)
+        self.assertFalse(s.to_numpy().flags.c_contiguous)
+        s._ensure_contiguous()
+        self.assertTrue(s.to_numpy().flags.c_contiguous)
+        s = TensorArray(x, make_contiguous=True)
+        self.assertTrue(s.to_numpy().flags.c_contiguous)
+
     def test_operations(self):
         x = np.ones([5, 3])
 
@@ -63,6 +77,16 @@ class TestTensor(unittest.TestCase):
         s2 = TensorArray(x)
         self.assertTrue(np.all(s1 == s2))
 
+        # comparisons over a column of scalars produce a plain boolean mask
+        s3 = TensorArray(np.arange(3))
+        result = s3 == np.array([0, 5, 2])
+        self.assertTrue(isinstance(result, np.ndarray))
+        npt.assert_array_equal(result, [True, False, True])
+
+        # comparisons that Numpy can't do element-wise are errors
+        with self.assertRaises(TypeError):
+            s3 == "a"
+
         # less, greater
         s2 = TensorArray(x * 2)
         self.assertTrue(np.all(s1 < s2))
@@ -238,6 +262,18 @@ class TestTensor(unittest.TestCase):
         expected = np.empty((0, 2))
         npt.assert_array_equal(result.to_numpy(), expected)
 
+    def test_isna(self):
+        x = np.ones([3, 2, 2])
+        x[1, 1, 0] = np.nan
+        s = TensorArray(x)
+        npt.assert_array_equal(s.isna(), [False, True, False])
+
+        s = TensorArray(np.array([1.0, np.nan, 3.0]))
+        npt.assert_array_equal(s.isna(), [False, True, False])
+
+        s = TensorArray(np.arange(6).reshape((3, 2)))
+        npt.assert_array_equal(s.isna(), [False, False, False])
+
     def test_asarray(self):
         x = np.array([[1, 2], [3, 4], [5, 6]])
         s = TensorArray(x)
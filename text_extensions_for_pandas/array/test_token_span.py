@@ -129,6 +129,10 @@ class TokenSpanArrayTest(ArrayTestBase):
         with self.assertRaises(TypeError):
             TokenSpanArray(self._make_spans_of_tokens(), "Not a valid begins list", [42])
 
+        # Token offsets are narrowed to int32
+        self.assertEqual(arr.begin_token.dtype, np.int32)
+        self.assertEqual(arr.end_token.dtype, np.int32)
+
     def test_dtype(self):
         arr = self._make_spans()
         self.assertTrue(isinstance(arr.dtype, TokenSpanType))
@@ -140,6 +144,49 @@ class TokenSpanArrayTest(ArrayTestBase):
         arr = self._make_spans()
         self.assertEqual(arr[2].covered_text, "a")
         self._assertArrayEquals(arr[2:4].covered_text, ["a", "test"])
+        s = arr[5]
+        self.assertEqual(s, TokenSpan(arr.tokens, 2, 4))
+        self.assertEqual((s.begin, s.end), (8, 14))
+        arr[5] = None
+        self.assertEqual(repr(arr[5]), "Nil")
+
+    def test_getitem_after_setitem(self):
+        # Element access without the cached character offsets of the whole
+        # array must give the same spans as access with them.
+        arr = self._make_spans()
+        arr[1] = TokenSpan(arr.tokens, 2, 2)
+        arr[2] = None
+        for i in range(len(arr) - 1):
+            arr[i] = arr[i + 1]
+            self.assertFalse("_char_offsets" in getattr(arr, "_cache", {}))
+            self.assertEqual((arr[i].begin, arr[i].end),
+                             (arr.begin[i], arr.end[i]))
+            self.assertEqual(arr[i].covered_text, arr.covered_text[i])
+        self.assertEqual(repr(arr[1]), "Nil")
+        self.assertEqual((arr[0].begin, arr[0].end), (8, 8))
+        self.assertEqual(arr[len(arr) - 1], TokenSpan(arr.tokens, 0, 4))
+
+    def test_span_accessor(self):
+        arr = self._make_spans()
+        s = pd.Series(arr)
+        self.assertEqual(s.span.begin.tolist(), [0, 5, 8, 10, 0, 8, 0])
+        self.assertEqual(s.span.end.tolist(), [4, 7, 9, 14, 7, 14, 14])
+        # The begin and end Series are writable copies.
+        begins = s.span.begin
+        begins.iloc[0] = 99
+        ends = s.span.end
+        ends.iloc[0] = 99
+        self.assertEqual(arr.begin[0], 0)
+        self.assertEqual(arr.end[0], 4)
+        self.assertEqual(arr[0].covered_text, "This")
+
+    def test_array(self):
+        arr = self._make_spans()
+        arr[5] = None
+        np_arr = np.asarray(arr)
+        self.assertEqual(np_arr.dtype, np.object)
+        self.assertEqual(np_arr.tolist(), [arr[i] for i in range(len(arr))])
+        self.assertEqual(repr(np_arr[5]), "Nil")
 
     def test_setitem(self):
         arr = self._make_spans()
@@ -159,6 +206,16 @@ class TokenSpanArrayTest(ArrayTestBase):
             arr.covered_text[0:4], [None, "a test", "This is", "This is a test"]
         )
 
+    def test_setitem_copies_series(self):
+        toks = self._make_spans_of_tokens()
+        begin_tokens = pd.Series([0, 1, 2], dtype=np.int32)
+        end_tokens = pd.Series([1, 2, 3], dtype=np.int32)
+        arr = TokenSpanArray(toks, begin_tokens, end_tokens)
+        arr[0] = arr[2]
+        self._assertArrayEquals(arr.covered_text, ["a", "is", "a"])
+        self.assertEqual(begin_tokens.tolist(), [0, 1, 2])
+        self.assertEqual(end_tokens.tolist(), [1, 2, 3])
+
     def test_equals(self):
         arr = self._make_spans()
         self._assertArrayEquals(arr[0:4] == arr[1], [False, True, False, False])
@@ -186,6 +243,31 @@ class TokenSpanArrayTest(ArrayTestBase):
         arr2 = TokenSpanArray._from_factorized(spans_list, arr)
         self._assertArrayEquals(arr.covered_text, arr2.covered_text)
 
+    def test_factorize_and_argsort(self):
+        arr = self._make_spans()
+        doubled = TokenSpanArray._concat_same_type([arr, arr])
+        codes, uniques = pd.factorize(doubled)
+        self.assertEqual(codes.tolist(), [0, 1, 2, 3, 4, 5, 6] * 2)
+        self._assertArrayEquals(
+            uniques.covered_text,
+            ["This", "is", "a", "test", "This is", "a test", "This is a test"],
+        )
+        arr[2] = None
+        self.assertEqual(arr.argsort().tolist(), [0, 4, 6, 1, 5, 3, 2])
+
+    def test_merge_different_tokens(self):
+        # Spans with the same token offsets over different tokens must not join.
+        toks = self._make_spans_of_tokens()
+        other_toks = CharSpanArray(
+            "Another test here", np.array([0, 8, 13]), np.array([7, 12, 17])
+        )
+        df1 = pd.DataFrame({"span": TokenSpanArray(toks, [0, 1, 2], [1, 2, 3])})
+        df2 = pd.DataFrame(
+            {"span": TokenSpanArray(other_toks, [0, 1, 2], [1, 2, 3])}
+        )
+        self.assertEqual(len(pd.merge(df1, df2, on="span")), 0)
+        self.assertEqual(len(pd.merge(df1, df1, on="span")), 3)
+
     def test_from_sequence(self):
         arr = self._make_spans()
         spans_list = [arr[i] for i in range(len(arr))]
@@ -221,6 +303,15 @@ class TokenSpanArrayTest(ArrayTestBase):
         self._assertArrayEquals(
             arr3.covered_text, ["is", "is", "a", "test", "a test", None]
         )
+        arr4 = arr.take(slice(1, 4))
+        self._assertArrayEquals(arr4.covered_text, ["is", "a", "test"])
+        # Modifying the slice must not affect the original or its cached state.
+        self._assertArrayEquals(arr.covered_text[1:4], ["is", "a", "test"])
+        arr4[0] = None
+        self._assertArrayEquals(arr4.covered_text, [None, "a", "test"])
+        self._assertArrayEquals(arr.covered_text[1:4], ["is", "a", "test"])
+        self.assertEqual(arr.begin_token.tolist()[1:4], [1, 2, 3])
+        self.assertFalse(arr.have_nulls)
 
     def test_less_than(self):
         tokens = self._make_spans_of_tokens()
@@ -281,6 +372,19 @@ class TokenSpanArrayTest(ArrayTestBase):
         self._assertArrayEquals(arr.begin, [0, 5, 8, 10, 0, 8, 0])
         self._assertArrayEquals(arr.end, [4, 7, 9, 14, 7, 14, 14])
 
+        # Zero-length and null spans
+        arr2 = TokenSpanArray(arr.tokens, [0, 2, 1, -1], [0, 2, 3, -1])
+        self._assertArrayEquals(arr2.begin, [0, 8, 5, -1])
+        self._assertArrayEquals(arr2.end, [0, 8, 9, -1])
+
+        # Offsets are read-only, but arrays built from them can be modified
+        for offsets in (arr.begin, arr.end, arr.begin_token, arr.end_token):
+            with self.assertRaises(ValueError):
+                offsets[0] = 1
+        arr3 = TokenSpanArray(arr.tokens, arr.begin_token, arr.end_token)
+        arr3[0] = None
+        self.assertEqual(arr.begin_token[0], 0)
+
     def test_normalized_covered_text(self):
         arr = self._make_spans()
         self._assertArrayEquals(
@@ -25,7 +25,7 @@ from typing import *
 
 import numpy as np
 import pandas as pd
-from memoized_property import memoized_property
+from pandas._libs.properties import cache_readonly
 
 # Internal imports
 import text_extensions_for_pandas.util as util
@@ -48,6 +48,8 @@ class TokenSpan(CharSpan):
     "not a span" in the sense that NaN is "not a number".
     """
 
+    __slots__ = ("_tokens", "_begin_token", "_end_token")
+
     def __init__(self, tokens: CharSpanArray, begin_token: int, end_token: int):
         """
         :param tokens: Tokenization information about the document, including
@@ -97,6 +99,34 @@ class TokenSpan(CharSpan):
         self._begin_token = begin_token
         self._end_token = end_token
 
+    @classmethod
+    def _simple_new(
+        cls, tokens: CharSpanArray, begin_token: int, end_token: int,
+        begin: int, end: int
+    ) -> "TokenSpan":
+        """
+        Fast-path constructor for internal use. Skips the argument checks in
+        `__init__()` and the lookup of character offsets in `tokens`, so the
+        caller must pass token and character offsets that are already
+        consistent with each other.
+
+        :param tokens: Tokenization information about the document, including
+        the target text.
+        :param begin_token: Begin offset (inclusive) within the tokenized text
+        :param end_token: End offset; exclusive, one past the last token
+        :param begin: Character offset of the beginning of the span
+        :param end: Character offset of the end of the span
+        :return: A new `TokenSpan` with the indicated offsets
+        """
+        ret = cls.__new__(cls)
+        ret._text = tokens.target_text
+        ret._begin = begin
+        ret._end = end
+        ret._tokens = tokens
+        ret._begin_token = begin_token
+        ret._end_token = end_token
+        return ret
+
     @classmethod
     def make_null(cls, tokens):
         """
@@ -222,6 +252,28 @@ class TokenSpanType(CharSpanType):
         return arrow_to_token_span(extension_array)
 
 
+# Dtypes are immutable, so every TokenSpanArray can share a single instance.
+_TOKEN_SPAN_TYPE = TokenSpanType()
+
+
+def _read_only_view(arr: np.ndarray) -> np.ndarray:
+    """
+    :param arr: Numpy array that callers must not modify
+    :return: A view of `arr` that rejects writes
+    """
+    view = arr.view()
+    view.setflags(write=False)
+    return view
+
+
+def _token_index_dtype(num_tokens: int) -> np.dtype:
+    """
+    :param num_tokens: Number of tokens that a `TokenSpanArray` indexes into
+    :return: The integer dtype to use for that array's token offsets
+    """
+    return np.dtype(np.int32 if num_tokens < 2 ** 31 else np.int64)
+
+
 class TokenSpanArray(CharSpanArray):
     """
     A Pandas `ExtensionArray` that represents a column of token-based spans
@@ -241,6 +293,7 @@ class TokenSpanArray(CharSpanArray):
     * `self._begin_tokens`: Numpy array of integer offsets in tokens. An offset
        of TokenSpan.NULL_OFFSET_VALUE here indicates a null value.
     * `self._end_tokens`: Numpy array of end offsets (1 + last token in span).
+       Both offset arrays are int32 unless there are too many tokens to fit.
     """
 
     @staticmethod
@@ -276,13 +329,22 @@ class TokenSpanArray(CharSpanArray):
         if not isinstance(end_tokens, (pd.Series, np.ndarray, list)):
             raise TypeError(f"end_tokens is of unsupported type {type(end_tokens)}. "
                             f"Supported types are Series, ndarray and List[int].")
+        # Store offsets in the narrowest integer type that can index the
+        # tokens. Converting here means that gathers and comparisons over the
+        # offsets elsewhere in this class run over half as much memory.
+        index_dtype = _token_index_dtype(len(tokens))
+        # Copy lists and Series so that `__setitem__()` doesn't modify the
+        # caller's data. Arrays are shared unless they need a dtype conversion
+        # or are read-only, such as the `begin_token` property of another array.
         begin_tokens = (
-            np.array(begin_tokens) if not isinstance(begin_tokens, np.ndarray)
-            else begin_tokens
+            np.require(begin_tokens, dtype=index_dtype, requirements=["C", "W"])
+            if isinstance(begin_tokens, np.ndarray)
+            else np.array(begin_tokens, dtype=index_dtype)
         )
         end_tokens = (
-            np.array(end_tokens) if not isinstance(end_tokens, np.ndarray)
-            else end_tokens
+            np.require(end_tokens, dtype=index_dtype, requirements=["C", "W"])
+            if isinstance(end_tokens, np.ndarray)
+            else np.array(end_tokens, dtype=index_dtype)
         )
         self._tokens = tokens  # Type: CharSpanArray
         self._begin_tokens = begin_tokens  # Type: np.ndarray
@@ -290,29 +352,87 @@ class TokenSpanArray(CharSpanArray):
         # Cached hash value
         self._hash = None
 
+    @classmethod
+    def _simple_new(
+        cls, tokens: CharSpanArray, begin_tokens: np.ndarray, end_tokens: np.ndarray
+    ) -> "TokenSpanArray":
+        """
+        Fast-path constructor for internal use, along the lines of Pandas'
+        `NDArrayBacked._simple_new()`. Skips the type checks and conversions in
+        `__init__()`, so the caller must pass `np.ndarray`s of token offsets
+        that are already valid for `tokens`.
+
+        :param tokens: Character-level span information about the underlying
+        tokens.
+        :param begin_tokens: Array of begin offsets measured in tokens
+        :param end_tokens: Array of end offsets measured in tokens
+        :return: A new `TokenSpanArray` that wraps the arguments without copying
+        """
+        ret = cls.__new__(cls)
+        ret._tokens = tokens
+        ret._begin_tokens = begin_tokens
+        ret._end_tokens = end_tokens
+        ret._hash = None
+        return ret
+
     ##########################################
     # Overrides of superclass methods go here.
 
     @property
     def dtype(self) -> pd.api.extensions.ExtensionDtype:
-        return TokenSpanType()
+        return _TOKEN_SPAN_TYPE
 
     def __len__(self) -> int:
         return len(self._begin_tokens)
 
+    def __array__(self, dtype=None) -> np.ndarray:
+        """
+        Interface to convert this array to a Numpy array of `TokenSpan`
+        objects. Builds all the spans in a single pass, instead of having Numpy
+        and Pandas fetch them one at a time via `__getitem__()`.
+        """
+        tokens = self._tokens
+        result = np.empty(len(self), dtype=object)
+        result[:] = [
+            TokenSpan._simple_new(tokens, bt, et, b, e)
+            for bt, et, b, e in zip(
+                self._begin_tokens.tolist(), self._end_tokens.tolist(),
+                self.begin.tolist(), self.end.tolist()
+            )
+        ]
+        return result if dtype is None else np.asarray(result, dtype=dtype)
+
     def __getitem__(self, item) -> Union[TokenSpan, "TokenSpanArray"]:
         """
         See docstring in `ExtensionArray` class in `pandas/core/arrays/base.py`
         for information about this method.
         """
         if isinstance(item, int):
-            return TokenSpan(
-                self._tokens, int(self._begin_tokens[item]), int(self._end_tokens[item])
+            begin_token = int(self._begin_tokens[item])
+            end_token = int(self._end_tokens[item])
+            cache = getattr(self, "_cache", {})
+            if "_char_offsets" in cache:
+                # Reuse the memoized character offsets when they're already
+                # there, but don't build them for the whole array just to look
+                # up one element.
+                begins, ends = cache["_char_offsets"]
+                begin, end = int(begins[item]), int(ends[item])
+            elif begin_token == TokenSpan.NULL_OFFSET_VALUE:
+                begin = end = TokenSpan.NULL_OFFSET_VALUE
+            else:
+                begin = int(self._tokens.begin[begin_token])
+                end = (
+                    begin
+                    if begin_token == end_token
+                    else int(self._tokens.end[end_token - 1])
+                )
+            return TokenSpan._simple_new(
+                self._tokens, begin_token, end_token, begin, end
             )
         else:
             # item not an int --> assume it's a numpy-compatible index
-            return TokenSpanArray(
-                self._tokens, self.begin_token[item], self.end_token[item]
+            return TokenSpanArray._simple_new(
+                self._tokens, self._begin_tokens[item], self._end_tokens[item]
             )
 
     def __setitem__(self, key: Union[int, np.ndarray, list, slice], value: Any) -> None:
@@ -395,15 +515,17 @@ class TokenSpanArray(CharSpanArray):
         if len(to_concat) == 0:
             raise ValueError("Can't concatenate zero TokenSpanArrays")
         # Require exact object equality of the tokens for now.
+        # Inputs are usually slices of a single column and share the same
+        # tokens object, so check identity before comparing contents.
         tokens = to_concat[0].tokens
-        for c in to_concat:
-            if not c.tokens.equals(tokens):
+        for c in to_concat[1:]:
+            if c.tokens is not tokens and not c.tokens.equals(tokens):
                 raise ValueError(
                     "Can only concatenate spans that are over " "the same set of tokens"
                 )
-        begin_tokens = np.concatenate([a.begin_token for a in to_concat])
-        end_tokens = np.concatenate([a.end_token for a in to_concat])
-        return TokenSpanArray(tokens, begin_tokens, end_tokens)
+        begin_tokens = np.concatenate([a._begin_tokens for a in to_concat])
+        end_tokens = np.concatenate([a._end_tokens for a in to_concat])
+        return TokenSpanArray._simple_new(tokens, begin_tokens, end_tokens)
 
     @classmethod
     def _from_factorized(cls, values, original):
@@ -418,6 +540,16 @@ class TokenSpanArray(CharSpanArray):
         end_tokens = np.array([v.end_token for v in values], dtype=np.int)
         return TokenSpanArray(original.tokens, begin_tokens, end_tokens)
 
+    def _values_for_argsort(self) -> np.ndarray:
+        """
+        See docstring in `ExtensionArray` class in `pandas/core/arrays/base.py`
+        for information about this method.
+        """
+        if self._begin_tokens.dtype != np.int32:
+            return super()._values_for_argsort()
+        # Spans sort by begin token, then by end token.
+        return self._packed_offsets()
+
     @classmethod
     def _from_sequence(cls, scalars, dtype=None, copy=False):
         """
@@ -460,8 +592,8 @@ class TokenSpanArray(CharSpanArray):
         See docstring in `ExtensionArray` class in `pandas/core/arrays/base.py`
         for information about this method.
         """
-        ret = TokenSpanArray(
-            self.tokens, self.begin_token.copy(), self.end_token.copy()
+        ret = TokenSpanArray._simple_new(
+            self.tokens, self._begin_tokens.copy(), self._end_tokens.copy()
         )
         # TODO: Copy cached properties
         return ret
@@ -473,6 +605,25 @@ class TokenSpanArray(CharSpanArray):
         See docstring in `ExtensionArray` class in `pandas/core/arrays/base.py`
         for information about this method.
         """
+        if isinstance(indices, slice):
+            # Slices have no fill values to handle. Copy the sliced views so
+            # that __setitem__() on the result can't leave stale cached
+            # properties on this array.
+            return TokenSpanArray._simple_new(
+                self.tokens,
+                self._begin_tokens[indices].copy(),
+                self._end_tokens[indices].copy(),
+            )
+
+        # Convert the indices once instead of once per array below.
+        indices = np.asarray(indices, dtype=np.intp)
+        if not allow_fill:
+            return TokenSpanArray._simple_new(
+                self.tokens,
+                self._begin_tokens.take(indices),
+                self._end_tokens.take(indices),
+            )
+
         # From API docs: "[If allow_fill == True, then] negative values in
         # `indices` indicate missing values. These values are set to
         # `fill_value`.
@@ -490,18 +641,18 @@ class TokenSpanArray(CharSpanArray):
         # Pandas' internal implementation of take() does most of the heavy
         # lifting.
         begins = pd.api.extensions.take(
-            self.begin_token,
+            self._begin_tokens,
             indices,
-            allow_fill=allow_fill,
+            allow_fill=True,
             fill_value=fill_value.begin_token,
         )
         ends = pd.api.extensions.take(
-            self.end_token,
+            self._end_tokens,
             indices,
-            allow_fill=allow_fill,
+            allow_fill=True,
             fill_value=fill_value.end_token,
         )
-        return TokenSpanArray(self.tokens, begins, ends)
+        return TokenSpanArray._simple_new(self.tokens, begins, ends)
 
     def __lt__(self, other) -> np.ndarray:
         """
@@ -552,7 +703,7 @@ class TokenSpanArray(CharSpanArray):
             )
         new_begin_tokens = np.minimum(self.begin_token, other.begin_token)
         new_end_tokens = np.maximum(self.end_token, other.end_token)
-        return TokenSpanArray(self.tokens, new_begin_tokens, new_end_tokens)
+        return TokenSpanArray._simple_new(self.tokens, new_begin_tokens, new_end_tokens)
 
     def _reduce(self, name, skipna=True, **kwargs):
         """
@@ -671,86 +822,53 @@ class TokenSpanArray(CharSpanArray):
         """
         return self._tokens.target_text
 
-    @memoized_property
+    @cache_readonly
     def nulls_mask(self) -> np.ndarray:
         """
         :return: A boolean mask indicating which rows are nulls
         """
         return self._begin_tokens == TokenSpan.NULL_OFFSET_VALUE
 
-    @memoized_property
+    @cache_readonly
     def have_nulls(self) -> bool:
         """
         :return: True if this column contains one or more nulls
         """
         return np.any(self.nulls_mask)
 
-    @memoized_property
+    @property
     def begin(self) -> np.ndarray:
         """
-        :return: the *character* offsets of the span begins.
+        :return: the *character* offsets of the span begins, as a read-only
+        array. Make a copy if you need to modify the offsets.
         """
-        result = self._tokens.begin[self.begin_token]
-        # Correct for null values
-        result[self.nulls_mask] = TokenSpan.NULL_OFFSET_VALUE
-        return result
+        return self._char_offsets[0]
 
-    @memoized_property
+    @property
     def end(self) -> np.ndarray:
         """
-        :return: the *character* offsets of the span ends.
+        :return: the *character* offsets of the span ends, as a read-only
+        array. Make a copy if you need to modify the offsets.
         """
-        # Start out with the end of the last token in each span.
-        result = self._tokens.end[self.end_token - 1]
-        # Replace end offset with begin offset wherever the length in tokens
-        # is zero.
-        mask = self.end_token == self.begin_token
-        result[mask] = self.begin[mask]
-        # Correct for null values
-        result[self.nulls_mask] = TokenSpan.NULL_OFFSET_VALUE
-        return result
+        return self._char_offsets[1]
 
     @property
     def begin_token(self) -> np.ndarray:
         """
         :return: Token offsets of the span begins; that is, the index of the
-        first token in each span.
+        first token in each span. The result is a read-only view; use
+        `__setitem__()` to modify the spans in this array.
         """
-        return self._begin_tokens
+        return _read_only_view(self._begin_tokens)
 
     @property
     def end_token(self) -> np.ndarray:
         """
         :return: Token offsets of the span ends. That is, 1 + last token
-        present in the span, for each span in the column.
-        """
-        return self._end_tokens
-
-    def as_tuples(self) -> np.ndarray:
-        """
-        Returns (begin, end) pairs as an array of tuples
+        present in the span, for each span in the column. The result is a
+        read-only view; use `__setitem__()` to modify the spans in this array.
         """
-        return np.concatenate(
-            (self.begin.reshape((-1, 1)), self.end.reshape((-1, 1))), axis=1
-        )
-
-    @property
-    def covered_text(self) -> np.ndarray:
-        """
-        Returns an array of the substrings of `target_text` corresponding to
-        the spans in this array.
-        """
-        # TODO: Vectorized version of this
-        text = self.target_text
-        # Need dtype=np.object so we can return nulls
-        result = np.zeros(len(self), dtype=np.object)
-        for i in range(len(self)):
-            if self._begin_tokens[i] == TokenSpan.NULL_OFFSET_VALUE:
-                # Null value at this index
-                result[i] = None
-            else:
-                result[i] = text[self.begin[i] : self.end[i]]
-        return result
+        return _read_only_view(self._end_tokens)
 
     def as_frame(self) -> pd.DataFrame:
         """
@@ -770,6 +888,57 @@ class TokenSpanArray(CharSpanArray):
     ##########################################
     # Keep private and protected methods here.
 
+    def _packed_offsets(self) -> np.ndarray:
+        """
+        Pack the 32-bit begin and end token offsets of each span into a single
+        unsigned 64-bit integer, with the begin offset in the upper half. The
+        packed values compare in the same order as `(begin_token, end_token)`
+        tuples, so sorting them is a single pass over one contiguous integer
+        array instead of over boxed `TokenSpan` objects.
+
+        :return: Array of packed offsets, one per span
+        """
+        begins = self._begin_tokens.view(np.uint32).astype(np.uint64)
+        ends = self._end_tokens.view(np.uint32).astype(np.uint64)
+        return (begins << np.uint64(32)) | ends
+
+    @cache_readonly
+    def _char_offsets(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Translate token offsets to character offsets for the `begin` and `end`
+        properties. Both sets of offsets are computed and cached together,
+        since callers nearly always need both, and the end offsets reuse the
+        begin offsets and the null mask computed here.
+
+        :return: Tuple of Numpy arrays of begin and end character offsets
+        """
+        nulls_mask = self.nulls_mask
+        begin_tokens = self._begin_tokens
+        end_tokens = self._end_tokens
+        begins = self._tokens.begin[begin_tokens]
+        if np.all(end_tokens > begin_tokens):
+            # Fast path: No zero-length or null spans, so every span ends at
+            # the end of its last token.
+            ends = self._tokens.end[end_tokens - 1]
+        else:
+            # Zero-length spans end where they begin. The np.maximum() keeps a
+            # zero-length span at token 0 from reading off the front of the
+            # tokens array.
+            ends = np.where(
+                end_tokens == begin_tokens,
+                begins,
+                self._tokens.end[np.maximum(end_tokens - 1, 0)],
+            )
+        # Correct for null values
+        begins[nulls_mask] = TokenSpan.NULL_OFFSET_VALUE
+        ends[nulls_mask] = TokenSpan.NULL_OFFSET_VALUE
+        # These arrays are cached and shared with every caller, so they can be
+        # handed out without defensive copies only as long as nobody writes to
+        # them.
+        begins.setflags(write=False)
+        ends.setflags(write=False)
+        return begins, ends
+
     def _repr_html_(self) -> str:
         """
         HTML pretty-printing of a series of spans for Jupyter notebooks.
@@ -781,12 +950,9 @@ class TokenSpanArray(CharSpanArray):
         Remove cached values of memoized properties to reflect changes to the
         data on which they are based.
         """
-        # TODO: Figure out how to generate this list automatically
-        property_names = ["nulls_mask", "have_nulls", "begin", "end"]
-        for n in property_names:
-            attr_name = "_{0}".format(n)
-            if hasattr(self, attr_name):
-                delattr(self, attr_name)
+        # Properties decorated with @cache_readonly store their values in
+        # self._cache.
+        self._cache = {}
         self._hash = None
 
     def __arrow_array__(self, type=None):
@@ -405,56 +405,26 @@ def iob_to_spans(
     * `token_span`: Span (with token offsets) of each entity
     * `<value of entity_type_col_name>`: (optional) Entity type
     """
-    # Start out with 1-token prefixes of all entities.
-    begin_mask = token_features[iob_col_name] == "B"
-    first_tokens = token_features[begin_mask].index
-    if entity_type_col_name is None:
-        entity_types = np.zeros(len(first_tokens))
-    else:
-        entity_types = token_features[begin_mask][entity_type_col_name]
-
-    # Add an extra "O" tag to the end of the IOB column to simplify the logic
-    # for handling the case where the document ends with an entity.
-    iob_series = (
-        token_features[iob_col_name].append(pd.Series(["O"])).reset_index(drop=True)
-    )
-
-    entity_prefixes = pd.DataFrame(
-        {
-            "ent_type": entity_types,
-            "begin": first_tokens,  # Inclusive
-            "end": first_tokens + 1,  # Exclusive
-            "next_tag": iob_series.iloc[first_tokens + 1].values,
-        }
-    )
-
-    df_list = []  # Type: pd.DataFrame
-
-    if len(entity_prefixes.index) == 0:
-        # Code below needs at least one element in the list for schema
-        df_list = [entity_prefixes]
-
-    # Iteratively expand the prefixes
-    while len(entity_prefixes.index) > 0:
-        complete_mask = entity_prefixes["next_tag"].isin(["O", "B"])
-        complete_entities = entity_prefixes[complete_mask]
-        incomplete_entities = entity_prefixes[~complete_mask].copy()
-        incomplete_entities["end"] = incomplete_entities["end"] + 1
-        incomplete_entities["next_tag"] = iob_series.iloc[
-            incomplete_entities["end"]
-        ].values
-        df_list.append(complete_entities)
-        entity_prefixes = incomplete_entities
-    all_entities = pd.concat(df_list)
-
-    # Sort spans by location, not length.
-    all_entities.sort_values("begin", inplace=True)
+    # Map the tags to small integer codes (O == 0, B == 1, I == 2, anything else
+    # == -1) so that the scans below compare integers instead of strings. Tags
+    # that are already categorical, as in the output of
+    # `make_tokens_and_features`, are recoded without hashing any strings.
+    codes = pd.Categorical(
+        token_features[iob_col_name], categories=["O", "B", "I"]
+    ).codes
+    num_tokens = len(codes)
+
+    # Every entity starts at a "B" tag and extends up to, but not including,
+    # the next "O" or "B" tag, or to the end of the document. Find all the
+    # positions where an entity can end in one pass, then look up the end of
+    # each entity with a binary search.
+    begins = np.flatnonzero(codes == 1)
+    stops = np.append(np.flatnonzero((codes == 0) | (codes == 1)), num_tokens)
+    ends = stops[np.searchsorted(stops, begins, side="right")]
 
     # Convert [begin, end) pairs to spans
     entity_spans_array = TokenSpanArray(
-        token_features[char_span_col_name].values,
-        all_entities["begin"].values,
-        all_entities["end"].values,
+        token_features[char_span_col_name].values, begins, ends
     )
     if entity_type_col_name is None:
         return pd.DataFrame({"token_span": entity_spans_array})
@@ -462,7 +432,7 @@ def iob_to_spans(
         return pd.DataFrame(
             {
                 "token_span": entity_spans_array,
-                entity_type_col_name: all_entities["ent_type"].values,
+                entity_type_col_name: token_features[entity_type_col_name].values[begins],
             }
         )
 
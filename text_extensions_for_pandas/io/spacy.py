@@ -18,6 +18,11 @@
 #
 # I/O functions related to the SpaCy NLP library
 
+import collections
+import hashlib
+import weakref
+from typing import *
+
 import numpy as np
 import pandas as pd
 
@@ -36,6 +41,14 @@ from text_extensions_for_pandas.array import (
     TokenSpanType,
 )
 
+# The IOB categorical type for the "ent_iob" column, with "O" == 0, "B"==1,
+# "I"==2
+_IOB2_DTYPE = pd.CategoricalDtype(["O", "B", "I"], ordered=False)
+
+# spaCy encodes IOB tags as 0 == "", 1 == "I", 2 == "O", 3 == "B". This table
+# maps them directly to codes of _IOB2_DTYPE, with "" becoming a null.
+_SPACY_IOB_TO_IOB2_CODE = np.array([-1, 2, 0, 1], dtype=np.int8)
+
 
 def make_tokens(target_text: str, tokenizer) -> pd.Series:
     """
@@ -44,14 +57,20 @@ def make_tokens(target_text: str, tokenizer) -> pd.Series:
     :return: The tokens (and underlying text) as a Pandas Series wrapped around
         a `CharSpanArray` value.
     """
+    # Import inside the function to avoid a hard dependency on spaCy
+    from spacy.attrs import IDX, LENGTH
+
     spacy_doc = tokenizer(target_text)
-    tok_begins = np.array([t.idx for t in spacy_doc])
-    tok_ends = np.array([t.idx + len(t) for t in spacy_doc])
+    # Export the offset and length of every token in one pass
+    attrs = spacy_doc.to_array([IDX, LENGTH]).astype(np.int64)
+    tok_begins = attrs[:, 0]
+    tok_ends = tok_begins + attrs[:, 1]
     return pd.Series(CharSpanArray(target_text, tok_begins, tok_ends))
 
 
 def make_tokens_and_features(
     target_text: str, language_model, add_left_and_right=False,
+    use_cache: bool = False,
 ) -> pd.DataFrame:
     """
     :param target_text: Text to analyze
@@ -62,56 +81,245 @@ def make_tokens_and_features(
     :param add_left_and_right: If `True`, add columns "left" and "right"
     containing references to previous and next tokens.
 
+    :param use_cache: If `True`, keep the language model's output for the
+    most recent texts in an in-memory cache and reuse it when the same text
+    is analyzed again with the same language model object. Only use this
+    option if the language model's configuration does not change between
+    calls. The cache does not keep the language model alive; call
+    `clear_parse_cache()` to empty it.
+
     :return: A tuple of two dataframes:
     1. The tokens of the text plus additional linguistic features that the
        language model generates, represented as a `pd.DataFrame`.
     2. A table of named entities identified by the language model's named entity
        tagger, represented as a `pd.DataFrame`.
     """
-    spacy_doc = language_model(target_text)
+    if use_cache:
+        from spacy.tokens import Doc
+        spacy_doc = Doc(language_model.vocab).from_bytes(
+            _parse_to_bytes(target_text, language_model)
+        )
+    else:
+        spacy_doc = language_model(target_text)
+    return _make_tokens_and_features_from_doc(
+        spacy_doc, target_text, add_left_and_right
+    )
+
+
+def make_tokens_and_features_batch(
+    texts: Iterable[str], language_model, add_left_and_right=False,
+    batch_size: int = 50, n_process: int = 1,
+) -> Iterator[pd.DataFrame]:
+    """
+    Batched version of `make_tokens_and_features()` for analyzing many
+    documents. Runs the documents through the language model with
+    `spacy.language.Language.pipe()`, which processes them in batches and,
+    optionally, in multiple worker processes.
+
+    :param texts: Texts to analyze
+
+    :param language_model: Preconfigured spaCy language model (`spacy.language.Language`)
+     object
+
+    :param add_left_and_right: If `True`, add columns "left" and "right"
+    containing references to previous and next tokens.
+
+    :param batch_size: Number of texts that the language model processes
+    at once
+
+    :param n_process: Number of worker processes to use, or -1 to use all CPU
+    cores. Extra processes help with CPU-bound language models; they do not
+    help when the model runs on a GPU.
+
+    :return: An iterator over one DataFrame per element of `texts`, in the
+    same order as `texts`, each in the format that `make_tokens_and_features()`
+    returns.
+    """
+    for spacy_doc in language_model.pipe(
+        texts, batch_size=batch_size, n_process=n_process
+    ):
+        # spaCy's tokenization is non-destructive, so the Doc's text is the
+        # original input text.
+        yield _make_tokens_and_features_from_doc(
+            spacy_doc, spacy_doc.text, add_left_and_right
+        )
+
+
+def _make_tokens_and_features_from_doc(
+    spacy_doc, target_text: str, add_left_and_right: bool
+) -> pd.DataFrame:
+    """
+    Subroutine of `make_tokens_and_features()` and
+    `make_tokens_and_features_batch()`
+
+    :param spacy_doc: parsed document (`spacy.tokens.doc.Doc`) from a spaCy language
+     model
+
+    :param target_text: Text that `spacy_doc` was parsed from
+
+    :param add_left_and_right: If `True`, add columns "left" and "right"
+    containing references to previous and next tokens.
+
+    :return: The tokens of the text plus additional linguistic features that
+    the language model generates, represented as a `pd.DataFrame`.
+    """
+    # Import inside the function to avoid a hard dependency on spaCy
+    from spacy.attrs import (
+        IDX, LENGTH, LEMMA, POS, TAG, DEP, HEAD, SHAPE, ENT_IOB, ENT_TYPE,
+        IS_ALPHA, IS_STOP,
+    )
+
+    strings = spacy_doc.vocab.strings
+
+    # Pull all the per-token attributes we need out of the spaCy Doc in a
+    # single pass. Each column of the resulting matrix holds one attribute;
+    # string-valued attributes come back as hash values into the Doc's
+    # StringStore.
+    attrs = spacy_doc.to_array(
+        [IDX, LENGTH, LEMMA, POS, TAG, DEP, HEAD, SHAPE, ENT_IOB, ENT_TYPE,
+         IS_ALPHA, IS_STOP]
+    )
+    (idx_col, length_col, lemma_col, pos_col, tag_col, dep_col, head_col,
+     shape_col, ent_iob_col, ent_type_col, is_alpha_col, is_stop_col) = attrs.T
 
-    # TODO: Performance tuning of the translation code that follows
     # Represent the character spans of the tokens
-    tok_begins = np.array([t.idx for t in spacy_doc])
-    tok_ends = np.array([t.idx + len(t) for t in spacy_doc])
+    tok_begins = idx_col.astype(np.int64)
+    tok_ends = tok_begins + length_col.astype(np.int64)
     tokens_array = CharSpanArray(target_text, tok_begins, tok_ends)
-    tokens_series = pd.Series(tokens_array)
     # Also build single-token token-based spans to make it easier to build
     # larger token-based spans.
-    token_spans = TokenSpanArray.from_char_offsets(tokens_series.values)
-    # spaCy identifies tokens by semi-arbitrary integer "indexes" (in practice,
-    # the offset of the first character in the token). Translate from these
-    # to a dense range of integer IDs that will correspond to the index of our
-    # returned DataFrame.
-    idx_to_id = {spacy_doc[i].idx: i for i in range(len(spacy_doc))}
-    # Define the IOB categorical type with "O" == 0, "B"==1, "I"==2
-    iob2_dtype = pd.CategoricalDtype(["O", "B", "I"], ordered=False)
+    token_spans = TokenSpanArray.from_char_offsets(tokens_array)
+    # spaCy exports the head of each token as a signed offset relative to the
+    # token, stored in an unsigned int. Translate these offsets to token
+    # positions, which correspond to the index of our returned DataFrame.
+    heads = head_col.view(np.int64) + np.arange(len(spacy_doc))
+    # Token.lemma_ falls back on a lookup table for tokens that have no lemma
+    # assigned; do the same for the (rare) tokens with a lemma hash of zero.
+    lemmas = _hashes_to_strings(lemma_col, strings)
+    for i in np.flatnonzero(lemma_col == 0):
+        lemmas[i] = spacy_doc[int(i)].lemma_
+    # Every column below is already a Numpy array or extension array of its
+    # final type, so that the DataFrame constructor does not need to infer
+    # types or align indexes.
     df_cols = {
-        "id": range(len(tok_begins)),
-        "char_span": tokens_series,
+        "id": np.arange(len(tok_begins)),
+        "char_span": tokens_array,
         "token_span": token_spans,
-        "lemma": [t.lemma_ for t in spacy_doc],
-        "pos": pd.Categorical([str(t.pos_) for t in spacy_doc]),
-        "tag": pd.Categorical([str(t.tag_) for t in spacy_doc]),
-        "dep": pd.Categorical([str(t.dep_) for t in spacy_doc]),
-        "head": np.array([idx_to_id[t.head.idx] for t in spacy_doc]),
-        "shape": pd.Categorical([t.shape_ for t in spacy_doc]),
-        "ent_iob": pd.Categorical([str(t.ent_iob_) for t in spacy_doc],
-                                  dtype=iob2_dtype),
-        "ent_type": pd.Categorical([str(t.ent_type_) for t in spacy_doc]),
-        "is_alpha": np.array([t.is_alpha for t in spacy_doc]),
-        "is_stop": np.array([t.is_stop for t in spacy_doc]),
-        "sentence": _make_sentences_series(spacy_doc, tokens_array),
+        "lemma": lemmas,
+        "pos": _hashes_to_categorical(pos_col, strings),
+        "tag": _hashes_to_categorical(tag_col, strings),
+        "dep": _hashes_to_categorical(dep_col, strings),
+        "head": heads,
+        "shape": _hashes_to_categorical(shape_col, strings),
+        "ent_iob": pd.Categorical.from_codes(
+            _SPACY_IOB_TO_IOB2_CODE[ent_iob_col.astype(np.intp)],
+            dtype=_IOB2_DTYPE,
+        ),
+        "ent_type": _hashes_to_categorical(ent_type_col, strings),
+        "is_alpha": is_alpha_col.astype(np.bool_),
+        "is_stop": is_stop_col.astype(np.bool_),
+        "sentence": _make_sentences_series(spacy_doc, tokens_array).values,
     }
     if add_left_and_right:
-        # Use nullable int type because these columns contain nulls
-        df_cols["left"] = pd.array(
-            [None] + list(range(len(tok_begins) - 1)), dtype=pd.Int32Dtype()
-        )
-        df_cols["right"] = pd.array(
-            list(range(1, len(tok_begins))) + [None], dtype=pd.Int32Dtype()
-        )
-    return pd.DataFrame(df_cols)
+        # Use nullable int type because these columns contain nulls. Build
+        # the values and null masks of the nullable arrays directly.
+        positions = np.arange(len(tok_begins), dtype=np.int32)
+        left = positions - 1
+        right = positions + 1
+        df_cols["left"] = pd.arrays.IntegerArray(left, left < 0)
+        df_cols["right"] = pd.arrays.IntegerArray(right, right >= len(tok_begins))
+    return pd.DataFrame(df_cols, copy=False)
+
+
+# Maximum number of parsed documents that the cache behind
+# `make_tokens_and_features(..., use_cache=True)` keeps per language model.
+_PARSE_CACHE_SIZE = 256
+
+# Cache of serialized parse results. Maps each language model to an
+# `OrderedDict` from a digest of the input text to the output of
+# `spacy.tokens.Doc.to_bytes()`, in least to most recently used order. Weak
+# references to the language models let them be garbage-collected, along with
+# their entries, once nothing else uses them.
+_PARSE_CACHE = weakref.WeakKeyDictionary()
+
+
+def clear_parse_cache():
+    """
+    Discard all the results that `make_tokens_and_features()` has cached for
+    calls with `use_cache=True`.
+    """
+    _PARSE_CACHE.clear()
+
+
+def _parse_to_bytes(target_text: str, language_model) -> bytes:
+    """
+    Subroutine of `make_tokens_and_features()` that caches the results of
+    running the language model over recently seen texts. Stores serialized
+    Docs rather than the Docs themselves, so that each caller gets its own
+    copy and cached entries don't hold on to any per-Doc state.
+
+    :param target_text: Text to analyze
+
+    :param language_model: Preconfigured spaCy language model (`spacy.language.Language`)
+     object. Part of the cache key, by object identity.
+
+    :return: Output of `spacy.tokens.Doc.to_bytes()` on the parsed document
+    """
+    model_cache = _PARSE_CACHE.setdefault(language_model, collections.OrderedDict())
+    # Key on a digest so that the cache doesn't keep a copy of every text.
+    key = hashlib.sha1(target_text.encode("utf-8")).digest()
+    if key in model_cache:
+        model_cache.move_to_end(key)
+        return model_cache[key]
+    result = language_model(target_text).to_bytes()
+    model_cache[key] = result
+    if len(model_cache) > _PARSE_CACHE_SIZE:
+        # Evict the least recently used entry.
+        model_cache.popitem(last=False)
+    return result
+
+
+def _lookup_hashes(hashes: np.ndarray, strings) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Subroutine of `make_tokens_and_features()`
+
+    :param hashes: Column of string hash values from `spacy.tokens.Doc.to_array()`
+
+    :param strings: The `spacy.strings.StringStore` that the hashes refer to
+
+    :return: A tuple of two arrays: the strings for the distinct values in
+     `hashes`, and the index into the first array of each element of `hashes`.
+     Each distinct hash value is only looked up once.
+    """
+    uniques, inverse = np.unique(hashes, return_inverse=True)
+    names = np.array([strings[int(h)] for h in uniques], dtype=object)
+    return names, inverse
+
+
+def _hashes_to_strings(hashes: np.ndarray, strings) -> np.ndarray:
+    """
+    Subroutine of `make_tokens_and_features()`
+
+    :return: A Numpy array of Python strings, one per element of `hashes`.
+     See `_lookup_hashes()` for the arguments.
+    """
+    names, inverse = _lookup_hashes(hashes, strings)
+    return names[inverse]
+
+
+def _hashes_to_categorical(hashes: np.ndarray, strings) -> pd.Categorical:
+    """
+    Subroutine of `make_tokens_and_features()`
+
+    :return: A `pd.Categorical` of the strings that `hashes` refer to, with the
+     categories in sorted order, as `pd.Categorical` would produce from the
+     strings themselves. See `_lookup_hashes()` for the arguments.
+    """
+    names, inverse = _lookup_hashes(hashes, strings)
+    # Sort the categories by name. This also merges any duplicate names, in
+    # case two hash values map to the same string.
+    categories, name_codes = np.unique(names, return_inverse=True)
+    return pd.Categorical.from_codes(name_codes[inverse], categories=categories)
 
 
 def _make_sentences_series(spacy_doc, tokens: CharSpanArray):
@@ -127,13 +335,18 @@ def _make_sentences_series(spacy_doc, tokens: CharSpanArray):
     :return: a Pandas DataFrame Series containing the token span of the (single)
     sentence that the token is in
     """
-    num_toks = len(spacy_doc)
-    # Generate the [begin, end) intervals that make up a series of spans
-    begin_tokens = np.full(shape=num_toks, fill_value=-1, dtype=np.int)
-    end_tokens = np.full(shape=num_toks, fill_value=-1, dtype=np.int)
-    for sent in spacy_doc.sents:
-        begin_tokens[sent.start : sent.end] = sent.start
-        end_tokens[sent.start : sent.end] = sent.end
+    sents = list(spacy_doc.sents)
+    sent_begins = np.fromiter((sent.start for sent in sents), dtype=np.int32,
+                              count=len(sents))
+    sent_ends = np.fromiter((sent.end for sent in sents), dtype=np.int32,
+                            count=len(sents))
+    # Generate the [begin, end) intervals that make up a series of spans.
+    # spaCy's sentences cover every token of the document in order, so
+    # repeating each sentence's offsets once per token in the sentence
+    # produces one entry per token.
+    sent_lengths = sent_ends - sent_begins
+    begin_tokens = np.repeat(sent_begins, sent_lengths)
+    end_tokens = np.repeat(sent_ends, sent_lengths)
     return pd.Series(TokenSpanArray(tokens, begin_tokens, end_tokens))
 
 
@@ -170,52 +383,49 @@ def token_features_to_tree(
     """
 
     # displaCy expects most inputs as strings. Centralize this conversion.
+    # Returns a list of Python strings, one per row of token_features.
     def _get_text(col_name):
         if col_name is None:
-            return np.zeros(shape=len(token_features.index), dtype=str)
+            return [""] * len(token_features.index)
         series = token_features[col_name]
         if isinstance(series.dtype, (CharSpanType, TokenSpanType)):
-            return series.values.covered_text
+            return series.values.covered_text.tolist()
         else:
-            return series.astype(str)
+            return series.astype(str).tolist()
 
-    # Renumber the head column to a dense range starting from zero
-    tok_map = {token_features.index[i]: i for i in range(len(token_features.index))}
+    # Renumber the head column to a dense range starting from zero.
     # Note that we turn any links to tokens not in our input rows into
     # self-links, which will get removed later on.
-    head_tok = token_features["head"].values
-    remapped_head_tok = []
-    for i in range(len(token_features.index)):
-        remapped_head_tok.append(tok_map[head_tok[i]] if head_tok[i] in tok_map else i)
-
-    words_df = pd.DataFrame({"text": _get_text(text_col), "tag": _get_text(tag_col)})
-    edges_df = pd.DataFrame(
-        {
-            "from": range(len(token_features.index)),
-            "to": remapped_head_tok,
-            "label": _get_text(label_col),
-        }
-    )
+    index = token_features.index
+    heads = token_features["head"].values
+    from_tok = np.arange(len(index))
+    if index.is_unique:
+        head_pos = index.get_indexer(heads)
+    else:
+        # get_indexer() needs unique labels. Map each repeated label to its
+        # last row, as a dict from label to position would.
+        last_mask = ~index.duplicated(keep="last")
+        last_pos = index[last_mask].get_indexer(heads)
+        head_pos = np.where(last_pos == -1, -1, np.flatnonzero(last_mask)[last_pos])
+    to_tok = np.where(head_pos == -1, from_tok, head_pos)
+
+    words = [
+        {"text": text, "tag": tag}
+        for text, tag in zip(_get_text(text_col), _get_text(tag_col))
+    ]
     # displaCy requires all arcs to have their start and end be in
     # numeric order. An additional attribute "dir" tells which way
     # (left or right) each arc goes.
-    arcs_df = pd.DataFrame(
-        {
-            "start": edges_df[["from", "to"]].min(axis=1),
-            "end": edges_df[["from", "to"]].max(axis=1),
-            "label": edges_df["label"],
-            "dir": "left",
-        }
-    )
-    arcs_df["dir"].mask(edges_df["from"] > edges_df["to"], "right", inplace=True)
-
-    # Don't render self-links
-    arcs_df = arcs_df[arcs_df["start"] != arcs_df["end"]]
-
-    return {
-        "words": words_df.to_dict(orient="records"),
-        "arcs": arcs_df.to_dict(orient="records"),
-    }
+    starts = np.minimum(from_tok, to_tok).tolist()
+    ends = np.maximum(from_tok, to_tok).tolist()
+    dirs = np.where(from_tok > to_tok, "right", "left").tolist()
+    arcs = [
+        {"start": start, "end": end, "label": label, "dir": direction}
+        for start, end, label, direction in zip(starts, ends, _get_text(label_col), dirs)
+        # Don't render self-links
+        if start != end
+    ]
+    return {"words": words, "arcs": arcs}
 
 
 def render_parse_tree(
@@ -18,14 +18,9 @@
 #
 # I/O functions related to SystemT-format data files.
 
-import pandas as pd
+import itertools
 
-# Set to True to use sparse storage for tokens 2-n of n-token dictionary
-# entries. First token is always stored dense, of course.
-# Currently set to False to avoid spurious Pandas API warnings about conversion
-# from sparse to dense.
-# TODO: Turn this back on when Pandas fixes the issue with the warning.
-_SPARSE_DICT_ENTRIES = False
+import pandas as pd
 
 
 def load_dict(file_name: str, tokenizer: "spacy.tokenizer.Tokenizer"):
@@ -43,27 +38,25 @@ def load_dict(file_name: str, tokenizer: "spacy.tokenizer.Tokenizer"):
     :return: a `pd.DataFrame` with the normalized entries.
     """
     with open(file_name, "r") as f:
-        lines = [
-            line.strip() for line in f.readlines() if len(line) > 0 and line[0] != "#"
-        ]
+        # Stream the entries from the file straight into the tokenizer.
+        # Note that lines that are blank apart from the newline are entries
+        # too, albeit empty ones.
+        lines = (
+            line.strip().lower() for line in f if len(line) > 0 and line[0] != "#"
+        )
 
-    # Tokenize with SpaCy. Produces a SpaCy document object per line.
-    tokenized_entries = [tokenizer(line.lower()) for line in lines]
+        # Tokenize with SpaCy, in batches. Produces a SpaCy document object per
+        # line.
+        tokenized_entries = tokenizer.pipe(lines, batch_size=1000)
 
-    # Determine the number of tokens in the longest dictionary entry.
-    max_num_toks = max([len(e) for e in tokenized_entries])
+        # Turn each entry into a row of token strings, terminated with a None
+        # so that even the longest entry ends up None-terminated.
+        rows = [[t.text for t in e] + [None] for e in tokenized_entries]
 
-    # Generate a column for each token. Go one past the max number of tokens so
-    # that every dictionary entry ends up None-terminated.
-    cols_dict = {}
-    for i in range(max_num_toks + 1):
-        # Extract token i from every entry that has a token i
-        toks_list = [e[i].text if len(e) > i else None for e in tokenized_entries]
-        cols_dict["toks_{}".format(i)] = (
-            # Sparse storage for tokens 2 and onward
-            toks_list
-            if i == 0 or not _SPARSE_DICT_ENTRIES
-            else pd.SparseArray(toks_list)
-        )
+    # Transpose the rows into one column per token position in a single pass,
+    # padding the shorter entries with None.
+    cols = itertools.zip_longest(*rows, fillvalue=None)
+
+    cols_dict = {"toks_{}".format(i): list(toks) for i, toks in enumerate(cols)}
 
     return pd.DataFrame(cols_dict)
@@ -17,6 +17,7 @@ import numpy as np
 import unittest
 import textwrap
 
+from text_extensions_for_pandas.array import CharSpanArray
 from text_extensions_for_pandas.io.conll import *
 from text_extensions_for_pandas.io.spacy import make_tokens_and_features
 
@@ -57,6 +58,40 @@ class CoNLLTest(unittest.TestCase):
             ),
         )
 
+    def test_iob_to_spans_nan_tags_and_index(self):
+        text = "Peter Peeper packed a puck of liquid flubber in New York ."
+        words = text.split(" ")
+        begins = np.cumsum([0] + [len(w) + 1 for w in words[:-1]])
+        ends = begins + np.array([len(w) for w in words])
+        df = pd.DataFrame(
+            {
+                "char_span": CharSpanArray(text, begins, ends),
+                # Missing tags don't end an entity, same as "I" tags.
+                "ent_iob": ["B", "I", np.nan, "O", "B", np.nan,
+                            "B", "I", "O", "B", "I", None],
+                "ent_type": ["PER", "PER", None, None, "MISC", None,
+                             "MISC", "MISC", None, "LOC", "LOC", None],
+            },
+            # Spans use token positions, not index labels.
+            index=np.arange(100, 112),
+        )
+        spans = iob_to_spans(df)
+        # print(f"****{spans}****")
+        self.assertEqual(
+            str(spans),
+            textwrap.dedent(
+                """\
+                                       token_span ent_type
+                0  [0, 19): 'Peter Peeper packed'      PER
+                1             [22, 29): 'puck of'     MISC
+                2      [30, 44): 'liquid flubber'     MISC
+                3          [48, 58): 'New York .'      LOC"""
+            ),
+        )
+        self.assertEqual(
+            str(iob_to_spans(df.reset_index(drop=True))), str(spans)
+        )
+
     def test_spans_to_iob(self):
         df = make_tokens_and_features(
             textwrap.dedent(
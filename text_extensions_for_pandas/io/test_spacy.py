@@ -13,11 +13,16 @@
 #  limitations under the License.
 #
 
+import gc
 import numpy as np
+import pandas as pd
 import unittest
 import textwrap
+import types
+import weakref
 
 from text_extensions_for_pandas.io.spacy import *
+from text_extensions_for_pandas.io.spacy import _make_sentences_series
 
 import spacy
 
@@ -93,6 +98,79 @@ class IOTest(unittest.TestCase):
             ),
         )
 
+    def test_make_tokens_and_features_cache(self):
+        text = "She sold c shills by the Sith Lord."
+        expected = make_tokens_and_features(text, _SPACY_LANGUAGE_MODEL)
+        for _ in range(2):
+            df = make_tokens_and_features(text, _SPACY_LANGUAGE_MODEL,
+                                          use_cache=True)
+            self.assertEqual(str(df.to_records()), str(expected.to_records()))
+
+    def test_make_tokens_and_features_cache_release(self):
+        from spacy.lang.en import English
+
+        def make_nlp():
+            nlp = English()
+            nlp.add_pipe(nlp.create_pipe("sentencizer"))
+            return nlp
+
+        nlp = make_nlp()
+        text = "She sold c shills by the Sith Lord."
+        expected = make_tokens_and_features(text, nlp)
+        df = make_tokens_and_features(text, nlp, use_cache=True)
+        self.assertEqual(str(df.to_records()), str(expected.to_records()))
+
+        # The cache must not keep the language model alive.
+        nlp_ref = weakref.ref(nlp)
+        del nlp
+        gc.collect()
+        self.assertIsNone(nlp_ref())
+
+        nlp = make_nlp()
+        make_tokens_and_features(text, nlp, use_cache=True)
+        clear_parse_cache()
+        df = make_tokens_and_features(text, nlp, use_cache=True)
+        self.assertEqual(str(df.to_records()), str(expected.to_records()))
+
+    def test_make_tokens_and_features_batch(self):
+        texts = ["She sold c shills by the Sith Lord.",
+                 "Peter Peeper packed a puck of liquid flubber."]
+        dfs = list(make_tokens_and_features_batch(
+            texts, _SPACY_LANGUAGE_MODEL, add_left_and_right=True, batch_size=1
+        ))
+        self.assertEqual(len(dfs), 2)
+        for text, df in zip(texts, dfs):
+            expected = make_tokens_and_features(
+                text, _SPACY_LANGUAGE_MODEL, add_left_and_right=True
+            )
+            self.assertEqual(str(df.to_records()), str(expected.to_records()))
+
+    def test_make_sentences_series(self):
+        from spacy.lang.en import English
+        nlp = English()
+        nlp.add_pipe(nlp.create_pipe("sentencizer"))
+
+        # Empty document
+        doc = nlp("")
+        toks = make_tokens("", nlp.tokenizer)
+        sents = _make_sentences_series(doc, toks.values)
+        self.assertEqual(len(sents), 0)
+
+        # Zero-length sentences cover no tokens, so they produce no rows.
+        text = "Hello there. Bye."
+        doc = nlp(text)
+        toks = make_tokens(text, nlp.tokenizer)
+        doc_with_empty_sents = types.SimpleNamespace(
+            sents=[doc[0:0], doc[0:3], doc[3:3], doc[3:5], doc[5:5]]
+        )
+        sents = _make_sentences_series(doc_with_empty_sents, toks.values)
+        self.assertEqual(sents.values.begin_token.tolist(), [0, 0, 0, 3, 3])
+        self.assertEqual(sents.values.end_token.tolist(), [3, 3, 3, 5, 5])
+        self.assertEqual(
+            sents.values.covered_text.tolist(),
+            ["Hello there.", "Hello there.", "Hello there.", "Bye.", "Bye."],
+        )
+
     def test_token_features_to_tree(self):
         df = make_tokens_and_features(
             "Peter Peeper packed a puck of liquid flubber.", _SPACY_LANGUAGE_MODEL
@@ -124,6 +202,38 @@ class IOTest(unittest.TestCase):
         }
         self.assertDictEqual(json, expected)
 
+    def test_token_features_to_tree_duplicate_index(self):
+        # Heads that point to a repeated index label go to the label's last
+        # row, and heads outside the index become self-links.
+        df = pd.DataFrame(
+            {
+                "token_span": ["Peter", "Peeper", "packed", "a", "puck", "."],
+                "tag": ["NNP", "NNP", "VBD", "DT", "NN", "."],
+                "dep": ["compound", "nsubj", "ROOT", "det", "dobj", "punct"],
+                "head": [11, 12, 12, 14, 12, 99],
+            },
+            index=[10, 11, 12, 14, 14, 12],
+        )
+        json = token_features_to_tree(df)
+        expected = {
+            "words": [
+                {"text": "Peter", "tag": "NNP"},
+                {"text": "Peeper", "tag": "NNP"},
+                {"text": "packed", "tag": "VBD"},
+                {"text": "a", "tag": "DT"},
+                {"text": "puck", "tag": "NN"},
+                {"text": ".", "tag": "."},
+            ],
+            "arcs": [
+                {"start": 0, "end": 1, "label": "compound", "dir": "left"},
+                {"start": 1, "end": 5, "label": "nsubj", "dir": "left"},
+                {"start": 2, "end": 5, "label": "ROOT", "dir": "left"},
+                {"start": 3, "end": 4, "label": "det", "dir": "left"},
+                {"start": 4, "end": 5, "label": "dobj", "dir": "left"},
+            ],
+        }
+        self.assertDictEqual(json, expected)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,67 @@
+#
+#  Copyright (c) 2020 IBM Corp.
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+import unittest
+import warnings
+
+from spacy.lang.en import English
+
+from text_extensions_for_pandas.spanner.extract import extract_dict
+from text_extensions_for_pandas.io import load_dict, make_tokens
+from text_extensions_for_pandas.util import TestBase
+
+# SpaCy tokenizer (only) setup
+nlp = English()
+_tokenizer = nlp.Defaults.create_tokenizer(nlp)
+
+_DICT = load_dict("test_data/io/test_systemt/test.dict", _tokenizer)
+
+
+class ExtractTest(TestBase):
+    def test_extract_dict(self):
+        toks = make_tokens(
+            "Help me! I am trapped in a haiku factory! Dictionary entry.",
+            _tokenizer,
+        )
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            df = extract_dict(toks, _DICT)
+        self.assertEqual(
+            sorted(df["match"].values.covered_text),
+            [
+                "Dictionary entry",
+                "Help me! I am trapped",
+                "entry",
+                "in a haiku factory!",
+            ],
+        )
+
+    def test_extract_dict_no_partial_matches(self):
+        # "help" starts an entry, but no token continues it, so the partial
+        # matches run out before reaching the longest entry.
+        toks = make_tokens("help help", _tokenizer)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            df = extract_dict(toks, _DICT)
+        self.assertEqual(len(df), 0)
+
+        toks = make_tokens("Nothing to see here", _tokenizer)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            df = extract_dict(toks, _DICT)
+        self.assertEqual(len(df), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()